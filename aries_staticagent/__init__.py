@@ -11,7 +11,12 @@ from .message import (
     InvalidProtocolIdentifier,
     InvalidType,
 )
-from .dispatcher import Dispatcher, HandlerDispatcher, QueueDispatcher
+from .dispatcher import (
+    Dispatcher,
+    FutureDispatcher,
+    HandlerDispatcher,
+    QueueDispatcher,
+)
 from . import operators
 
 from . import crypto
@@ -19,6 +24,7 @@ from . import crypto
 __all__ = [
     "Connection",
     "Dispatcher",
+    "FutureDispatcher",
     "HandlerDispatcher",
     "InvalidProtocolIdentifier",
     "InvalidType",
@@ -1,12 +1,15 @@
 """Static Agent Connection."""
 import asyncio
-from contextlib import asynccontextmanager, contextmanager
+import hashlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from functools import partial
 import json
 from typing import (
     Awaitable,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -15,18 +18,63 @@ from typing import (
     Union,
 )
 import uuid
+import weakref
+
+import aiohttp
 
 from . import crypto
-from .dispatcher import Dispatcher, HandlerDispatcher, QueueDispatcher
+from .dispatcher import (
+    Dispatcher,
+    FutureDispatcher,
+    HandlerDispatcher,
+    QueueDispatcher,
+)
 from .message import Message, MsgType
 from .module import Module
-from .utils import ensure_key_bytes, forward_msg, http_send
-from .operators import msg_type_is, is_reply_to
+from .utils import (
+    ensure_key_bytes,
+    gather_or_cancel,
+    http_send,
+    normalize_key,
+    serialize_forward,
+)
+from .operators import is_reply_to
 
 
 Send = Callable[[bytes, str], Awaitable[Optional[bytes]]]
 SessionSend = Callable[[bytes], Awaitable[None]]
 ConditionFutureMap = Dict[Callable[[Message], bool], asyncio.Future]
+HTTPSessions = Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession]
+
+
+async def _close_http_sessions(sessions: HTTPSessions, *, keep_current=False):
+    """Close and remove pooled sessions that can be closed from this loop.
+
+    Those are the session of the running loop, unless keep_current, and the
+    sessions of closed loops. A session on another open loop can only be
+    closed from that loop.
+    """
+    running = asyncio.get_running_loop()
+    for loop in list(sessions):
+        if loop.is_closed() or (loop is running and not keep_current):
+            await sessions.pop(loop).close()
+
+
+def _close_blocking_loop(loop: asyncio.AbstractEventLoop, sessions: HTTPSessions):
+    """Close the pooled sessions on a loop for blocking calls, then the loop.
+
+    Also used as the connection's finalizer, so it must not reference the
+    connection itself.
+    """
+    if loop.is_closed():
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop is running in this thread, so loop can close its sessions
+        loop.run_until_complete(_close_http_sessions(sessions))
+    finally:
+        loop.close()
 
 
 class MessageDeliveryError(Exception):
@@ -42,6 +90,8 @@ class Session:
 
     THREAD_ALL = "all"
 
+    __slots__ = ("_id", "_conn", "_send", "_send_is_coroutine", "_thread", "_status")
+
     def __init__(
         self, conn: "Connection", send: SessionSend, thread: Optional[str] = None
     ):
@@ -58,6 +108,8 @@ class Session:
         self._id = str(uuid.uuid4())
         self._conn = conn
         self._send = send
+        # Checked once; other callables may still return awaitables
+        self._send_is_coroutine = asyncio.iscoroutinefunction(send)
         self._thread = thread
         self._status = None
 
@@ -73,19 +125,20 @@ class Session:
 
     def update_thread_from_msg(self, msg: Message):
         """Update a thread with info from the ~transport decorator."""
-        if "~transport" not in msg and self._thread is None:
+        transport = msg.get("~transport")
+        if not transport:
             return
 
-        transport = msg["~transport"]
-        if transport["return_route"] == "all":
+        return_route = transport.get("return_route")
+        if return_route == "all":
             self._thread = self.THREAD_ALL
             return
 
-        if transport["return_route"] == "thread":
+        if return_route == "thread":
             self._thread = transport["return_route_thread"]
             return
 
-        if transport["return_route"] == "none":
+        if return_route == "none":
             self._thread = None
             return
 
@@ -103,7 +156,7 @@ class Session:
             raise RuntimeError("Session is not set to return route")
 
         ret = self._send(message)
-        if asyncio.iscoroutine(ret):
+        if self._send_is_coroutine or asyncio.iscoroutine(ret):
             return await ret
 
         return ret
@@ -116,6 +169,13 @@ class Session:
         """
         return await self._conn.handle(message, self)
 
+    def __enter__(self):
+        self._conn._sessions.add(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._conn._sessions.discard(self)
+
     def __hash__(self):
         return hash(self.session_id)
 
@@ -156,9 +216,12 @@ class Keys:
             """Get verkey based DID for this connection."""
             return self.keys.did
 
+    __slots__ = ("_verkey", "_verkey_b58", "_sigkey", "_did")
+
     def __init__(self, verkey: Key, sigkey: Key):
-        self._verkey = ensure_key_bytes(verkey)
+        self._verkey, self._verkey_b58 = normalize_key(verkey)
         self._sigkey = ensure_key_bytes(sigkey)
+        self._did = crypto.bytes_to_b58(self._verkey[:16])
 
     @property
     def verkey(self):
@@ -168,7 +231,7 @@ class Keys:
     @property
     def verkey_b58(self):
         """Get Base58 encoded verkey."""
-        return crypto.bytes_to_b58(self.verkey)
+        return self._verkey_b58
 
     @property
     def sigkey(self):
@@ -178,7 +241,7 @@ class Keys:
     @property
     def did(self):
         """Get verkey based DID for this connection."""
-        return crypto.bytes_to_b58(self._verkey[:16])
+        return self._did
 
     def __str__(self):
         return "Keys({}, {}...)".format(
@@ -189,6 +252,8 @@ class Keys:
 class Target:
     """Container for information about our message destination."""
 
+    __slots__ = ("endpoint", "recipients", "routing_keys")
+
     def __init__(
         self,
         *,
@@ -208,10 +273,10 @@ class Target:
             self.recipients = [ensure_key_bytes(their_vk)]
 
         if recipients:
-            self.recipients = list(map(ensure_key_bytes, recipients))
+            self.recipients = [ensure_key_bytes(key) for key in recipients]
 
         if routing_keys:
-            self.routing_keys = list(map(ensure_key_bytes, routing_keys))
+            self.routing_keys = [ensure_key_bytes(key) for key in routing_keys]
 
     def update(
         self,
@@ -233,10 +298,10 @@ class Target:
             self.recipients = [ensure_key_bytes(their_vk)]
 
         if recipients:
-            self.recipients = list(map(ensure_key_bytes, recipients))
+            self.recipients = [ensure_key_bytes(key) for key in recipients]
 
         if routing_keys:
-            self.routing_keys = list(map(ensure_key_bytes, routing_keys))
+            self.routing_keys = [ensure_key_bytes(key) for key in routing_keys]
 
 
 class Connection(Keys.Mixin):
@@ -301,7 +366,11 @@ class Connection(Keys.Mixin):
 
         send (Send): Specify the send method for this connection. See notes
             above for function signature.  Defaults to
-            `aries_staticagent.utils.http_send`.
+            `aries_staticagent.utils.http_send` over a pooled HTTP session
+            owned by the connection; release it with `close()` or by using
+            the connection as an async context manager (or, when using the
+            blocking send methods, as a regular context manager; failing
+            that, it is released when the connection is garbage collected).
 
         dispatcher (aries_staticagent.dispatcher.Dispatcher): Specify a
             dispatcher for this connection.  Defaults to
@@ -309,6 +378,10 @@ class Connection(Keys.Mixin):
     """
 
     DEFAULT_TIMEOUT = 5
+    PACK_CACHE_MAX = 128
+    PACK_OFFLOAD_MIN = 4096
+    # Creates the loop blocking calls run on; e.g. uvloop.new_event_loop
+    BLOCKING_LOOP_FACTORY = staticmethod(asyncio.new_event_loop)
 
     def __init__(
         self,
@@ -329,10 +402,53 @@ class Connection(Keys.Mixin):
                     mod = mod()
                 self.route_module(mod)
 
-        self._send: Send = send or http_send
+        self._http_sessions: HTTPSessions = {}
+        self._blocking_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._blocking_finalizer: Optional[weakref.finalize] = None
+        self._send: Send = send or self._pooled_http_send
         self._dispatcher: Dispatcher = dispatcher or HandlerDispatcher()
         self._router: HandlerDispatcher = self._dispatcher
+        self._awaiting = FutureDispatcher()
         self._sessions: Set[Session] = set()
+        self._pack_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._blocking_finalizer is not None:
+            self._blocking_finalizer()
+        self._blocking_loop = self._blocking_finalizer = None
+
+    async def _pooled_http_send(self, msg: bytes, endpoint: str) -> Optional[bytes]:
+        """Send over HTTP, reusing pooled connections across sends.
+
+        A pool can only be used on the loop it was created on, so one is kept
+        per loop. Pools left on loops that have since closed are closed when
+        a new pool is made.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._http_sessions.get(loop)
+        if session is None or session.closed:
+            await _close_http_sessions(self._http_sessions, keep_current=True)
+            session = self._http_sessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+            )
+        return await http_send(msg, endpoint, session=session)
+
+    async def close(self):
+        """Close pooled HTTP connections held by this connection, if any.
+
+        Pools on other loops that are still open are left to be closed from
+        those loops.
+        """
+        await _close_http_sessions(self._http_sessions)
 
     @classmethod
     def from_parts(
@@ -426,8 +542,12 @@ class Connection(Keys.Mixin):
     async def dispatch(self, message):
         """
         Dispatch message to handler.
+
+        Messages awaited through `await_message` or the send and await
+        methods are claimed before reaching the handler.
         """
-        await self._dispatcher.dispatch(message, self)
+        if not self._awaiting.claim(message):
+            await self._dispatcher.dispatch(message, self)
 
     @asynccontextmanager
     async def queue(self, condition: Optional[Callable[[Message], bool]] = None):
@@ -444,11 +564,45 @@ class Connection(Keys.Mixin):
             await queue_dispatcher.flush()
             self._dispatcher = original
 
+    def _next(
+        self,
+        *,
+        msg_type: Optional[Union[str, Iterable[str]]] = None,
+        condition: Optional[Callable[[Message], bool]] = None,
+    ) -> asyncio.Future:
+        """Return a future for the next message of msg_type or meeting condition.
+
+        msg_type may be several types, any of which resolves the future.
+
+        Other messages are processed through registered handlers. Callers
+        must cancel the future when no longer waiting.
+        """
+        if msg_type is not None:
+            # Type takes precedence; typed futures are found by index
+            condition = None
+        return self._awaiting.future(msg_type=msg_type, condition=condition)
+
     def unpack(self, packed_message: Union[bytes, dict]) -> Message:
         """Unpack a message, filling out metadata in the MTC."""
+        decoded = packed_message
+        if isinstance(packed_message, bytes):
+            try:
+                # Decode once; reused as the message itself if plaintext
+                decoded = json.loads(packed_message)
+            except ValueError:
+                msg = Message.deserialize(packed_message)
+                msg.mtc.set_plaintext()
+                return msg
+
+            if isinstance(decoded, dict) and "protected" not in decoded:
+                # Not an encrypted envelope; skip straight to plaintext
+                msg = Message.from_dict(decoded)
+                msg.mtc.set_plaintext()
+                return msg
+
         try:
             (unpacked_msg, sender_vk, recip_vk) = crypto.unpack_message(
-                packed_message, self.verkey, self.sigkey
+                decoded, self.verkey, self.sigkey
             )
             msg = Message.deserialize(unpacked_msg)
             if sender_vk:
@@ -461,15 +615,79 @@ class Connection(Keys.Mixin):
                 raise TypeError(
                     "Expected bytes, got {}".format(type(packed_message).__name__)
                 )
-            msg = Message.deserialize(packed_message)
+            msg = Message.from_dict(decoded)
             msg.mtc.set_plaintext()
 
         return msg
 
     def pack(
-        self, msg: Union[dict, Message], anoncrypt=False, plaintext=False
+        self,
+        msg: Union[dict, Message],
+        anoncrypt=False,
+        plaintext=False,
+        cacheable=False,
+    ) -> bytes:
+        """Pack a message for sending over the wire.
+
+        If cacheable, packed bytes are memoized and returned as is when the
+        same message is packed again for the same target. Only use this for
+        messages that may be resent with identical ciphertext, such as pings.
+        """
+        serialized = self._serialize_for_pack(msg, anoncrypt, plaintext)
+        if not cacheable:
+            return self._pack_serialized(serialized, anoncrypt, plaintext)
+
+        # Keyed by digest so cached entries don't also hold every message body
+        target = self.target
+        key = (
+            hashlib.blake2b(serialized, digest_size=16).digest(),
+            anoncrypt,
+            plaintext,
+            tuple(target.recipients or ()) if target else (),
+            tuple(target.routing_keys or ()) if target else (),
+        )
+        packed = self._pack_cache.get(key)
+        if packed is None:
+            packed = self._pack_serialized(serialized, anoncrypt, plaintext)
+            self._pack_cache[key] = packed
+            if len(self._pack_cache) > self.PACK_CACHE_MAX:
+                self._pack_cache.popitem(last=False)
+        else:
+            self._pack_cache.move_to_end(key)
+        return packed
+
+    async def pack_async(
+        self,
+        msg: Union[dict, Message],
+        anoncrypt=False,
+        plaintext=False,
+        cacheable=False,
+    ) -> bytes:
+        """Pack a message for sending over the wire.
+
+        Messages of at least PACK_OFFLOAD_MIN bytes are encrypted in the
+        loop's default executor so other tasks may run in the meantime.
+        Smaller messages, and those packed as plaintext or cacheable, are
+        packed as in `pack`.
+        """
+        if plaintext or cacheable:
+            return self.pack(
+                msg, anoncrypt=anoncrypt, plaintext=plaintext, cacheable=cacheable
+            )
+
+        serialized = self._serialize_for_pack(msg, anoncrypt, plaintext)
+        if len(serialized) < self.PACK_OFFLOAD_MIN:
+            return self._pack_serialized(serialized, anoncrypt, plaintext)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._pack_serialized, serialized, anoncrypt, plaintext
+        )
+
+    @staticmethod
+    def _serialize_for_pack(
+        msg: Union[dict, Message], anoncrypt: bool, plaintext: bool
     ) -> bytes:
-        """Pack a message for sending over the wire."""
+        """Validate pack arguments and serialize the message."""
         if plaintext and anoncrypt:
             raise ValueError("plaintext and anoncrypt flags are mutually exclusive.")
 
@@ -481,44 +699,49 @@ class Connection(Keys.Mixin):
                     f"msg must be type Message or dict; received {type(msg)}"
                 )
 
+        # Encoded once; used as is for plaintext and by the crypto layer
+        return msg.serialize().encode("ascii")
+
+    def _pack_serialized(
+        self, serialized: bytes, anoncrypt: bool, plaintext: bool
+    ) -> bytes:
+        """Pack an already serialized message."""
         if plaintext:
-            return msg.serialize().encode("ascii")
+            return serialized
 
-        if not self.target or not self.target.recipients:
+        target = self.target
+        recipients = target.recipients if target else None
+        if not recipients:
             raise RuntimeError("No recipients for whom to pack this message")
 
         if anoncrypt:
-            packed_message = crypto.pack_message(
-                msg.serialize(),
-                self.target.recipients,
-            )
+            packed_message = crypto.pack_message(serialized, recipients)
         else:
             packed_message = crypto.pack_message(
-                msg.serialize(),
-                self.target.recipients,
+                serialized,
+                recipients,
                 self.verkey,
                 self.sigkey,
             )
 
-        if self.target.routing_keys:
-            forward_to = self.target.recipients[0]
-            for routing_key in self.target.routing_keys:
+        if target.routing_keys:
+            forward_to = recipients[0]
+            for routing_key in target.routing_keys:
                 packed_message = crypto.pack_message(
-                    forward_msg(to=forward_to, msg=packed_message).serialize(),
+                    serialize_forward(forward_to, packed_message),
                     [routing_key],
                 )
                 forward_to = routing_key
 
-        return json.dumps(packed_message).encode("ascii")
+        # Compact separators: the envelope is only read by machines
+        return json.dumps(packed_message, separators=(",", ":")).encode("ascii")
 
-    @contextmanager
-    def session(self, send: SessionSend):
-        """Open a new session for this connection."""
+    def session(self, send: SessionSend) -> "Session":
+        """Open a new session for this connection.
 
-        session = Session(self, send)
-        self._sessions.add(session)
-        yield session
-        self._sessions.remove(session)
+        The session is open while used as a context manager.
+        """
+        return Session(self, send)
 
     def session_open(self) -> bool:
         """Check whether connection has sessions open."""
@@ -531,15 +754,15 @@ class Connection(Keys.Mixin):
         if not self._sessions:
             raise RuntimeError("Cannot send message to session; no open sessions")
 
-        sent = False
-        for session in self._sessions:
-            if not session.should_return_route():
-                continue
-
-            if session.thread == thread or session.thread_all():
-                await session.send(message)
-                sent = True
-        return sent
+        sends = [
+            session.send(message)
+            for session in self._sessions
+            if session.should_return_route()
+            and (session.thread == thread or session.thread_all())
+        ]
+        # Sessions are independent sockets; send to all of them concurrently
+        await asyncio.gather(*sends)
+        return bool(sends)
 
     async def handle(self, packed_message: bytes, session: Optional[Session] = None):
         """Unpack and dispatch message to handler."""
@@ -549,6 +772,44 @@ class Connection(Keys.Mixin):
 
         await self.dispatch(msg)
 
+    async def handle_many(
+        self, packed_messages: Iterable[bytes], session: Optional[Session] = None
+    ):
+        """Unpack a batch of messages, then dispatch them.
+
+        Without a session, messages are dispatched concurrently; if one
+        dispatch raises, the rest are cancelled and the error is raised.
+
+        With a session, each message's return route settings apply to the
+        session while that message is dispatched, so messages are dispatched
+        one after another in order, stopping at the first error.
+        """
+        msgs = [self.unpack(packed_message) for packed_message in packed_messages]
+        if not session:
+            await gather_or_cancel(*(self.dispatch(msg) for msg in msgs))
+            return
+
+        for msg in msgs:
+            session.update_thread_from_msg(msg)
+            await self.dispatch(msg)
+
+    @staticmethod
+    def _with_return_route(
+        msg: Union[dict, Message], return_route: Optional[str]
+    ) -> Message:
+        """Return msg as a Message, adding return_route if not already set."""
+        if isinstance(msg, Message):
+            if return_route and not msg.return_route:
+                msg = msg.with_transport(return_route=return_route)
+        elif isinstance(msg, dict):
+            # Add transport before construction rather than rebuilding after
+            if return_route and not msg.get("~transport", {}).get("return_route"):
+                msg = {**msg, "~transport": {"return_route": return_route}}
+            msg = Message.from_dict(msg)
+        else:
+            raise TypeError(f"msg must be type Message or dict; received {type(msg)}")
+        return msg
+
     async def send_async(
         self,
         msg: Union[dict, Message],
@@ -556,22 +817,19 @@ class Connection(Keys.Mixin):
         return_route: Optional[str] = None,
         plaintext: bool = False,
         anoncrypt: bool = False,
+        cacheable: bool = False,
     ):
-        """Send a message to the agent connected through this Connection."""
-        if isinstance(msg, Message):
-            pass
-        elif isinstance(msg, dict):
-            msg = Message.from_dict(msg)
-        else:
-            raise TypeError(f"msg must be type Message or dict; received {type(msg)}")
+        """Send a message to the agent connected through this Connection.
 
+        See `pack` for the meaning of cacheable.
+        """
         # TODO: Don't specify return route on messages sent to sessions?
-        if return_route and not msg.return_route:
-            msg = msg.with_transport(return_route=return_route)
-
-        packed_message = self.pack(msg, anoncrypt=anoncrypt, plaintext=plaintext)
+        msg = self._with_return_route(msg, return_route)
+        packed_message = await self.pack_async(
+            msg, anoncrypt=anoncrypt, plaintext=plaintext, cacheable=cacheable
+        )
 
-        if self.session_open():
+        if self._sessions:
             if await self.send_to_session(packed_message, msg.thread["thid"]):
                 return
 
@@ -590,6 +848,47 @@ class Connection(Keys.Mixin):
                 raise RuntimeError("Response received when no response was expected")
             await self.handle(response)
 
+    async def request_response(
+        self,
+        msg: Union[dict, Message],
+        *,
+        plaintext: bool = False,
+        anoncrypt: bool = False,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Message:
+        """Send a message and return the message in the transport response.
+
+        Fast path for request-response exchanges with return routing: the
+        response to the send is taken as the reply, so no condition is
+        registered or evaluated. In particular, the response is not checked
+        to be a reply to msg (see `is_reply_to`); whatever message the
+        endpoint returns is unpacked and returned. Use
+        `send_and_await_reply_async` when the reply may arrive some other way
+        or must be matched to msg.
+
+        Raises asyncio.TimeoutError if no response is returned within
+        timeout seconds.
+        """
+        msg = self._with_return_route(msg, "all")
+        if not self.target or not self.target.endpoint:
+            raise MessageDeliveryError(msg="Cannot send message; no endpoint.")
+
+        packed_message = await self.pack_async(
+            msg, anoncrypt=anoncrypt, plaintext=plaintext
+        )
+        try:
+            response = await asyncio.wait_for(
+                self._send(packed_message, self.target.endpoint), timeout
+            )
+        except asyncio.TimeoutError:
+            raise
+        except Exception as err:
+            raise MessageDeliveryError(msg=str(err)) from err
+
+        if not response:
+            raise MessageDeliveryError(msg="No response returned for message.")
+        return self.unpack(response)
+
     async def send_and_await_reply_async(
         self,
         msg: Union[dict, Message],
@@ -614,27 +913,31 @@ class Connection(Keys.Mixin):
         self,
         msg: Union[dict, Message],
         *,
-        type_: Optional[str] = None,
+        type_: Optional[Union[str, Iterable[str]]] = None,
         condition: Optional[Callable[[Message], bool]] = None,
         return_route: str = "all",
         plaintext: bool = False,
         anoncrypt: bool = False,
         timeout: int = DEFAULT_TIMEOUT,
     ) -> Message:
-        """Send a message and wait for a message to be returned."""
-        if type_:
-            condition = partial(msg_type_is, type_)
+        """Send a message and wait for a message to be returned.
 
-        async with self.queue(condition=condition) as queue:
+        type_ may be several types, such as a reply and a problem report,
+        any of which is returned.
+        """
+        next_message = self._next(msg_type=type_, condition=condition)
+        try:
             await self.send_async(
                 msg, return_route=return_route, plaintext=plaintext, anoncrypt=anoncrypt
             )
-            return await queue.get(timeout=timeout)
+            return await asyncio.wait_for(next_message, timeout)
+        finally:
+            next_message.cancel()
 
     async def await_message(
         self,
         *,
-        type_: Optional[str] = None,
+        type_: Optional[Union[str, Iterable[str]]] = None,
         condition: Optional[Callable[[Message], bool]] = None,
         timeout: int = DEFAULT_TIMEOUT,
     ):
@@ -645,26 +948,52 @@ class Connection(Keys.Mixin):
         the setup of this function. If it's likely that a message will arrive
         as a result of an action taken prior to calling await_message, use the
         `next` context manager instead.
+
+        type_ may be several types, any of which is returned.
+        """
+        next_message = self._next(msg_type=type_, condition=condition)
+        try:
+            return await asyncio.wait_for(next_message, timeout)
+        finally:
+            next_message.cancel()
+
+    @staticmethod
+    def configure_loop(loop: asyncio.AbstractEventLoop):
+        """Configure a loop for running connections.
+
+        Where available (Python 3.12+), tasks are created eagerly so those
+        completing without blocking, such as dispatches to handlers that
+        reply over a return route, skip a trip through the loop's queue.
+        Users running connections on their own loop may call this on it.
         """
-        if type_:
-            condition = partial(msg_type_is, type_)
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            loop.set_task_factory(eager_task_factory)
 
-        async with self.queue(condition=condition) as queue:
-            return await queue.get(timeout=timeout)
+    def _run_blocking(self, coro: Awaitable):
+        """Run coro to completion on the loop reserved for blocking calls.
+
+        The loop is created on first use and kept between calls so pooled
+        connections made on it remain usable. It is closed, along with those
+        connections, when a `with connection:` block exits, or else when the
+        connection is garbage collected or the interpreter exits.
+        """
+        if self._blocking_loop is None or self._blocking_loop.is_closed():
+            self._blocking_loop = self.BLOCKING_LOOP_FACTORY()
+            self.configure_loop(self._blocking_loop)
+            self._blocking_finalizer = weakref.finalize(
+                self, _close_blocking_loop, self._blocking_loop, self._http_sessions
+            )
+        return self._blocking_loop.run_until_complete(coro)
 
     def send(self, *args, **kwargs):
         """Blocking wrapper around send_async."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self.send_async(*args, **kwargs))
+        return self._run_blocking(self.send_async(*args, **kwargs))
 
     def send_and_await_reply(self, *args, **kwargs) -> Message:
         """Blocking wrapper around send_and_await_reply_async."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self.send_and_await_reply_async(*args, **kwargs))
+        return self._run_blocking(self.send_and_await_reply_async(*args, **kwargs))
 
     def send_and_await_returned(self, *args, **kwargs) -> Message:
         """Blocking wrapper around send_and_await_reply_async."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
-            self.send_and_await_returned_async(*args, **kwargs)
-        )
+        return self._run_blocking(self.send_and_await_returned_async(*args, **kwargs))
@@ -45,24 +45,26 @@ def bytes_to_b64(val: bytes, urlsafe=False) -> str:
     return base64.b64encode(val).decode("ascii")
 
 
-@lru_cache(maxsize=16)
+@lru_cache(maxsize=1024)
 def b58_to_bytes(val: str) -> bytes:
     """
     Convert a base 58 string to bytes.
 
-    Small cache provided for key conversions which happen frequently in pack
-    and unpack and message handling.
+    Cache provided for key conversions which happen frequently in pack
+    and unpack and message handling, and when setting up many connections
+    to the same keys.
     """
     return base58.b58decode(val)
 
 
-@lru_cache(maxsize=16)
+@lru_cache(maxsize=1024)
 def bytes_to_b58(val: bytes) -> str:
     """
     Convert a byte string to base 58.
 
-    Small cache provided for key conversions which happen frequently in pack
-    and unpack and message handling.
+    Cache provided for key conversions which happen frequently in pack
+    and unpack and message handling, and when setting up many connections
+    to the same keys.
     """
     return base58.b58encode(val).decode("ascii")
 
@@ -316,12 +318,14 @@ def prepare_pack_recipient_keys(
     cek = nacl.bindings.crypto_secretstream_xchacha20poly1305_keygen()
     recips = []
 
+    if from_verkey and from_sigkey:
+        sender_vk = bytes_to_b58(from_verkey).encode("ascii")
+        sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(from_sigkey)
+
     for target_vk in to_verkeys:
         target_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(target_vk)
         if from_verkey and from_sigkey:
-            sender_vk = bytes_to_b58(from_verkey).encode("ascii")
             enc_sender = nacl.bindings.crypto_box_seal(sender_vk, target_pk)
-            sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(from_sigkey)
 
             nonce = nacl.utils.random(nacl.bindings.crypto_box_NONCEBYTES)
             enc_cek = nacl.bindings.crypto_box(cek, nonce, target_pk, sk)
@@ -389,6 +393,7 @@ def locate_pack_recipient_key(
         ValueError: If no corresponding recipient key found
 
     """
+    my_verkey_b58 = bytes_to_b58(my_verkey)
     not_found = []
     for recip in recipients:
         if not recip or "header" not in recip or "encrypted_key" not in recip:
@@ -396,7 +401,7 @@ def locate_pack_recipient_key(
 
         recip_vk_b58 = recip["header"].get("kid")
 
-        if bytes_to_b58(my_verkey) != recip_vk_b58:
+        if my_verkey_b58 != recip_vk_b58:
             not_found.append(recip_vk_b58)
             continue
 
@@ -432,19 +437,17 @@ def locate_pack_recipient_key(
             sender_vk = None
             cek = nacl.bindings.crypto_box_seal_open(encrypted_key, pk, sk)
         return cek, sender_vk, recip_vk_b58
-    raise ValueError(
-        "Verkey {} not found in {}".format(bytes_to_b58(my_verkey), not_found)
-    )
+    raise ValueError("Verkey {} not found in {}".format(my_verkey_b58, not_found))
 
 
 def encrypt_plaintext(
-    message: str, add_data: bytes, key: bytes
+    message: Union[str, bytes], add_data: bytes, key: bytes
 ) -> Tuple[bytes, bytes, bytes]:
     """
     Encrypt the payload of a packed message.
 
     Args:
-        message: Message to encrypt
+        message: Message to encrypt, as a string or ASCII encoded bytes
         add_data:
         key: Key used for encryption
 
@@ -453,11 +456,11 @@ def encrypt_plaintext(
 
     """
     nonce = nacl.utils.random(nacl.bindings.crypto_aead_chacha20poly1305_ietf_NPUBBYTES)
-    message_bin = message.encode("ascii")
+    message_bin = message.encode("ascii") if isinstance(message, str) else message
     output = nacl.bindings.crypto_aead_chacha20poly1305_ietf_encrypt(
         message_bin, add_data, nonce, key
     )
-    mlen = len(message)
+    mlen = len(message_bin)
     ciphertext = output[:mlen]
     tag = output[mlen:]
     return ciphertext, nonce, tag
@@ -486,7 +489,7 @@ def decrypt_plaintext(
 
 
 def pack_message(
-    message: str,
+    message: Union[str, bytes],
     to_verkeys: Sequence[bytes],
     from_verkey: Optional[bytes] = None,
     from_sigkey: Optional[bytes] = None,
@@ -496,7 +499,7 @@ def pack_message(
     the sender.
 
     Args:
-        message: The message to pack
+        message: The message to pack, as a string or ASCII encoded bytes
         to_verkeys: The verkeys to pack the message for
         from_verkey: The sender verkey
         from_sigkey: The sender sigkey
@@ -1,8 +1,9 @@
 """Dispatchers and dispatcher related classes."""
 
 from .base import Dispatcher
+from .future_dispatcher import FutureDispatcher
 from .handler_dispatcher import HandlerDispatcher
 from .queue_dispatcher import QueueDispatcher
 
 
-__all__ = ["Dispatcher", "HandlerDispatcher", "QueueDispatcher"]
+__all__ = ["Dispatcher", "FutureDispatcher", "HandlerDispatcher", "QueueDispatcher"]
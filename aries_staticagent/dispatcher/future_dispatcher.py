@@ -0,0 +1,108 @@
+"""Dispatcher that resolves futures awaiting single messages."""
+
+import asyncio
+from collections import deque
+from functools import partial
+import logging
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import Dispatcher
+from ..message import Message, MsgType
+
+
+LOGGER = logging.getLogger(__name__)
+
+Condition = Callable[[Message], bool]
+
+
+class FutureDispatcher(Dispatcher):
+    """Dispatcher that resolves futures with the messages they await.
+
+    Each future is resolved by the first message meeting its condition;
+    messages not awaited are delegated to the "primary" dispatcher, if
+    present. Futures awaiting a message type are indexed by that type so
+    they are found without evaluating every pending condition.
+    """
+
+    def __init__(self, *, dispatcher: Optional[Dispatcher] = None):
+        """Init dispatcher."""
+        self.dispatcher = dispatcher
+        self._by_type: Dict[str, Deque[asyncio.Future]] = {}
+        self._conditional: List[Tuple[Optional[Condition], asyncio.Future]] = []
+
+    def future(
+        self,
+        *,
+        msg_type: Optional[Union[str, MsgType, Iterable[Union[str, MsgType]]]] = None,
+        condition: Optional[Condition] = None
+    ) -> asyncio.Future:
+        """Return a future for the next message of msg_type or meeting condition.
+
+        msg_type may also be several types, any of which resolves the future;
+        an empty set of types is rejected. With neither given, the next
+        message is claimed.
+        """
+        if msg_type is not None and condition is not None:
+            raise ValueError("msg_type and condition are mutually exclusive.")
+
+        msg_types = None
+        if msg_type is not None:
+            msg_types = (msg_type,) if isinstance(msg_type, str) else set(msg_type)
+            if not msg_types:
+                raise ValueError("msg_type must contain at least one type.")
+
+        future = asyncio.get_running_loop().create_future()
+        if msg_types is not None:
+            for type_ in msg_types:
+                self._by_type.setdefault(type_, deque()).append(future)
+                future.add_done_callback(partial(self._discard_typed, type_))
+        else:
+            self._conditional.append((condition, future))
+            future.add_done_callback(self._discard_conditional)
+        return future
+
+    def _discard_typed(self, msg_type: str, future: asyncio.Future):
+        waiting = self._by_type.get(msg_type)
+        if waiting and future in waiting:
+            waiting.remove(future)
+        if not waiting:
+            self._by_type.pop(msg_type, None)
+
+    def _discard_conditional(self, future: asyncio.Future):
+        self._conditional = [
+            entry for entry in self._conditional if entry[1] is not future
+        ]
+
+    def claim(self, msg: Message) -> bool:
+        """Resolve the first future awaiting msg, returning whether one was.
+
+        Futures are unlinked as they are resolved so messages arriving
+        before their done callbacks run do not find them again.
+        """
+        waiting = self._by_type.get(msg.type)
+        while waiting:
+            future = waiting.popleft()
+            if not future.done():
+                future.set_result(msg)
+                return True
+
+        for index, (condition, future) in enumerate(self._conditional):
+            if not future.done() and (not condition or condition(msg)):
+                del self._conditional[index]
+                future.set_result(msg)
+                return True
+
+        return False
+
+    async def dispatch(self, msg: Message, *args, **kwargs):
+        """Resolve awaiting future with message or delegate to primary."""
+        if self.claim(msg):
+            return
+        if self.dispatcher:
+            await self.dispatcher.dispatch(msg, *args, **kwargs)
+        else:
+            LOGGER.warning(
+                "Message dropped because it was not awaited and no primary "
+                "dispatcher. Message: %s",
+                msg,
+            )
@@ -21,15 +21,19 @@ class HandlerDispatcher(Dispatcher):
     is received.
     """
 
+    SELECTED_MAX = 256
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.handlers: Dict[str, Callable] = {}
         self.handler_versions: Dict[Tuple, SortedSet] = {}
+        self._selected: Dict[str, Callable] = {}
 
     def clear(self):
         """Clear routes"""
         self.handlers.clear()
         self.handler_versions.clear()
+        self._selected.clear()
 
     def add(self, msg_type: Union[str, MsgType], handler: Callable):
         """Add a handler to routing tables."""
@@ -37,6 +41,7 @@ class HandlerDispatcher(Dispatcher):
             msg_type = MsgType(msg_type)
 
         self.handlers[msg_type.normalized] = handler
+        self._selected.clear()
 
         key = (msg_type.doc_uri, msg_type.protocol, msg_type.name)
         if key not in self.handler_versions:
@@ -54,26 +59,40 @@ class HandlerDispatcher(Dispatcher):
             raise NoRegisteredHandlerException("Handler is not registered")
 
         del self.handlers[msg_type.normalized]
+        self._selected.clear()
         key = (msg_type.doc_uri, msg_type.protocol, msg_type.name)
-        self.handler_versions[key].remove(key)
+        self.handler_versions[key].remove(msg_type.version_info)
         if not self.handler_versions[key]:
             del self.handler_versions[key]
 
     def select(self, msg: Message) -> Optional[Callable]:
-        """Find the closest appropriate handler for a given message."""
-        key = (msg.type.doc_uri, msg.type.protocol, msg.type.name)
+        """Find the closest appropriate handler for a given message.
+
+        Selections are remembered by message type until routes change.
+        """
+        handler = self._selected.get(msg.type)
+        if handler is None:
+            handler = self._select(msg.type)
+            if handler is not None:
+                if len(self._selected) >= self.SELECTED_MAX:
+                    self._selected.clear()
+                self._selected[msg.type] = handler
+        return handler
+
+    def _select(self, msg_type: MsgType) -> Optional[Callable]:
+        key = (msg_type.doc_uri, msg_type.protocol, msg_type.name)
         if key not in self.handler_versions:
             return None
 
         registered_version_set = self.handler_versions[key]
         for version in reversed(registered_version_set):
-            if msg.type.version_info.major == version.major:
-                handler_type = MsgType.unparse(
-                    msg.type.doc_uri, msg.type.protocol, version, msg.type.name
-                )
-                return self.handlers[handler_type.normalized]
+            if msg_type.version_info.major == version.major:
+                # Same as the registered MsgType's normalized form; no reparse
+                return self.handlers[
+                    f"{msg_type.doc_uri}{msg_type.protocol}/{version}/{msg_type.name}"
+                ]
 
-            if msg.type.version_info.major > version.major:
+            if msg_type.version_info.major > version.major:
                 break
 
         return None
@@ -1,7 +1,6 @@
 """ Define Message base class. """
 from abc import ABC
-from functools import partial
-from operator import is_not
+from functools import lru_cache
 import re
 from typing import Any, ClassVar, Iterator, Mapping, Optional, Type, TypeVar, Union
 from uuid import uuid4
@@ -13,6 +12,11 @@ from semver import VersionInfo
 from .mtc import MessageTrustContext
 
 
+def _is_numeric_identifier(part: str) -> bool:
+    """Whether part is a semver numeric identifier (no sign or leading zeros)."""
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
 class MsgVersion(VersionInfo):  # pylint: disable=too-few-public-methods
     """Wrapper around the more complete VersionInfo class from semver package.
 
@@ -20,26 +24,29 @@ class MsgVersion(VersionInfo):  # pylint: disable=too-few-public-methods
     (i.e. 1.0 not 1.0.0).
     """
 
-    SEMVER_RE = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)(?:\.(0|[1-9]\d*))?$")
-
     @classmethod
+    @lru_cache(maxsize=64)
     def from_str(cls, version_str):
-        """Parse version information from a string."""
-        matches = cls.SEMVER_RE.match(version_str)
-        if matches:
-            args = list(matches.groups())
-            if not matches.group(3):
-                args.append("0")
-            return cls(*map(int, filter(partial(is_not, None), args)))
+        """Parse version information from a string.
 
-        parts = VersionInfo.parse(version_str)
+        Plain numeric versions (N.N or N.N.N) are parsed directly; anything
+        else falls back to the full semver parser. Results are cached as
+        message types share a small set of versions.
+        """
+        parts = version_str.split(".", 2)
+        if len(parts) == 2:
+            parts.append("0")
+        if len(parts) == 3 and all(map(_is_numeric_identifier, parts)):
+            return cls(*map(int, parts))
+
+        parsed = VersionInfo.parse(version_str)
 
         return cls(
-            parts.major,
-            parts.minor,
-            parts.patch,
-            parts.prerelease,
-            parts.build,
+            parsed.major,
+            parsed.minor,
+            parsed.patch,
+            parsed.prerelease,
+            parsed.build,
         )
 
 
@@ -52,25 +59,33 @@ class ProtocolIdentifier(str):
 
     PIURI_RE = re.compile(r"^(.*?)([a-z0-9._-]+)/(\d[^/]*)/?$")
 
-    def __init__(self, ident: str):
+    def __new__(cls, ident: str):
+        """Return the shared, parsed instance for this identifier string."""
+        return cls._intern(ident)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _intern(cls, ident: str) -> "ProtocolIdentifier":
         """Parse Protocol Identifier string."""
-        super().__init__()
-        matches = self.PIURI_RE.match(ident)
+        matches = cls.PIURI_RE.match(ident)
         if not matches:
             raise InvalidProtocolIdentifier(f"Invalid protocol identifier: {ident}")
         doc_uri, protocol, version = matches.groups()
         try:
-            self.version_info = MsgVersion.from_str(version)
+            version_info = MsgVersion.from_str(version)
         except ValueError as err:
             raise InvalidProtocolIdentifier(
                 f"Invalid protocol version {version}"
             ) from err
 
-        self.version = version
-        self.doc_uri = doc_uri
-        self.protocol = protocol
-        self.normalized = f"{self.doc_uri}{self.protocol}/{self.version_info}"
-        self.normalized_version = str(self.version_info)
+        instance = super().__new__(cls, ident)
+        instance.version_info = version_info
+        instance.version = version
+        instance.doc_uri = doc_uri
+        instance.protocol = protocol
+        instance.normalized = f"{doc_uri}{protocol}/{version_info}"
+        instance.normalized_version = str(version_info)
+        return instance
 
     @classmethod
     def unparse(cls, doc_uri: str, protocol: str, version: str):
@@ -86,27 +101,37 @@ class MsgType(str):
 
     MTURI_RE = re.compile(r"^(.*?)([a-z0-9._-]+)/(\d[^/]*)/([a-z0-9._-]+)$")
 
-    def __init__(self, msg_type: str):
-        """Parse Message Type string."""
-        super().__init__()
-        matches = self.MTURI_RE.match(msg_type)
+    def __new__(cls, msg_type: str):
+        """Return the shared, parsed instance for this message type string."""
+        return cls._intern(msg_type)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _intern(cls, msg_type: str) -> "MsgType":
+        """Parse Message Type string.
+
+        Parsed types are cached; routing and validation parse the same
+        handful of types over and over.
+        """
+        matches = cls.MTURI_RE.match(msg_type)
         if not matches:
             raise InvalidType(f"Invalid message type: {msg_type}")
 
         doc_uri, protocol, version, name = matches.groups()
         try:
-            self.version_info = MsgVersion.from_str(version)
+            version_info = MsgVersion.from_str(version)
         except ValueError as err:
             raise InvalidType(f"Invalid message type version {version}") from err
 
-        self.version = version
-        self.doc_uri = doc_uri
-        self.protocol = protocol
-        self.name = name
-        self.normalized = (
-            f"{self.doc_uri}{self.protocol}/{self.version_info}/{self.name}"
-        )
-        self.normalized_version = str(self.version_info)
+        instance = super().__new__(cls, msg_type)
+        instance.version_info = version_info
+        instance.version = version
+        instance.doc_uri = doc_uri
+        instance.protocol = protocol
+        instance.name = name
+        instance.normalized = f"{doc_uri}{protocol}/{version_info}/{name}"
+        instance.normalized_version = str(version_info)
+        return instance
 
     @classmethod
     def __get_validators__(cls):
@@ -148,6 +173,13 @@ class Message(BaseModel, Mapping[str, Any]):
     def __getitem__(self, item: str) -> Any:
         return self._alias_dict[item]
 
+    def __contains__(self, item: object) -> bool:
+        # Mapping's defaults go through __getitem__ and catch KeyError
+        return item in self._alias_dict
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._alias_dict.get(key, default)
+
     def __len__(self) -> int:
         return len(self.__dict__)
 
@@ -1,7 +1,7 @@
 """ Module base class """
 
 from abc import ABC
-from functools import partial
+from types import MappingProxyType, MethodType
 from typing import (
     Callable,
     ClassVar,
@@ -23,6 +23,8 @@ RouteFunc = TypeVar("RouteFunc", bound=Callable)
 class ModuleRouter(Mapping[MsgType, Callable]):
     """Collect module routes."""
 
+    __slots__ = ("protocol", "_routes")
+
     def __init__(
         self,
         protocol: Union[str, ProtocolIdentifier],
@@ -209,16 +211,21 @@ class ModuleRouter(Mapping[MsgType, Callable]):
     def __call__(self, *args, **kwargs):
         return self.route(*args, **kwargs)
 
-    def contextualize(self, context: object) -> Dict[MsgType, Callable]:
-        """Return routes with handlers wrapped as partials to include 'self'."""
-        return {
-            msg_type: partial(handler, context) for msg_type, handler in self.items()
-        }
+    def contextualize(self, context: object) -> Mapping[MsgType, Callable]:
+        """Return read-only routes with handlers bound to context as 'self'."""
+        return MappingProxyType(
+            {
+                msg_type: MethodType(handler, context)
+                for msg_type, handler in self._routes.items()
+            }
+        )
 
 
 class Module(ABC):  # pylint: disable=too-few-public-methods
     """Base Module class."""
 
+    __slots__ = ("_routes", "_protocol_identifier")
+
     protocol: ClassVar[Union[str, ProtocolIdentifier]]
     route: ClassVar[ModuleRouter]
 
@@ -68,6 +68,14 @@ PLAINTEXT_AFFIRMED = DESERIALIZE_OK
 PLAINTEXT_DENIED = CONFIDENTIALITY | INTEGRITY | AUTHENTICATED_ORIGIN
 # | NONREPUDIATION ?
 
+# Raw integer masks; int operations avoid Flag's Python-level operators
+_AUTHCRYPT_AFFIRMED = AUTHCRYPT_AFFIRMED.value
+_AUTHCRYPT_DENIED = AUTHCRYPT_DENIED.value
+_ANONCRYPT_AFFIRMED = ANONCRYPT_AFFIRMED.value
+_ANONCRYPT_DENIED = ANONCRYPT_DENIED.value
+_PLAINTEXT_AFFIRMED = PLAINTEXT_AFFIRMED.value
+_PLAINTEXT_DENIED = PLAINTEXT_DENIED.value
+
 
 class AdditionalData:
     """
@@ -126,12 +134,19 @@ class MessageTrustContext:
         return self._denied
 
     def __getitem__(self, context: Context):
-        if (self._affirmed & context) == context:
+        mask = context.value
+        if (self._affirmed.value & mask) == mask:
             return True
-        if (self._denied & context) == context:
+        if (self._denied.value & mask) == mask:
             return False
         return None
 
+    def _matches(self, affirmed: int, denied: int) -> bool:
+        """Whether affirmed and denied raw masks are all set."""
+        return (self._affirmed.value & affirmed) == affirmed and (
+            self._denied.value & denied
+        ) == denied
+
     def __setitem__(self, context: Context, value: Optional[bool]):
         if not isinstance(context, Context):
             raise TypeError("index must be of type Context")
@@ -187,12 +202,12 @@ class MessageTrustContext:
 
     def is_authcrypted(self):
         """MTC matches expected authcrypt."""
-        return self[AUTHCRYPT_AFFIRMED] is True and self[AUTHCRYPT_DENIED] is False
+        return self._matches(_AUTHCRYPT_AFFIRMED, _AUTHCRYPT_DENIED)
 
     def is_anoncrypted(self):
         """MTC matches expected anoncrypt."""
-        return self[ANONCRYPT_AFFIRMED] is True and self[ANONCRYPT_DENIED] is False
+        return self._matches(_ANONCRYPT_AFFIRMED, _ANONCRYPT_DENIED)
 
     def is_plaintext(self):
         """MTC matches expected plaintext."""
-        return self[PLAINTEXT_AFFIRMED] is True and self[PLAINTEXT_DENIED] is False
+        return self._matches(_PLAINTEXT_AFFIRMED, _PLAINTEXT_DENIED)
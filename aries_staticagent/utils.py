@@ -1,7 +1,10 @@
 """ General utils """
+import asyncio
 from functools import wraps
-from typing import Union, Optional, Callable
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, Union
+from uuid import uuid4
 import datetime
+import json
 
 import aiohttp
 
@@ -44,6 +47,16 @@ def ensure_key_b58(key: Union[bytes, str]):
     raise TypeError("key must be bytes or str")
 
 
+def normalize_key(key: Union[bytes, str]) -> Tuple[bytes, str]:
+    """Return key formatted as both bytes and b58 string."""
+    if isinstance(key, bytes):
+        return key, crypto.bytes_to_b58(key)
+    if isinstance(key, str):
+        return crypto.b58_to_bytes(key), key
+
+    raise TypeError("key must be bytes or str")
+
+
 FORWARD = "https://didcomm.org/routing/1.0/forward"
 
 
@@ -52,6 +65,18 @@ def forward_msg(to: Union[bytes, str], msg: dict):
     return Message.parse_obj({"@type": FORWARD, "to": ensure_key_b58(to), "msg": msg})
 
 
+def serialize_forward(to: Union[bytes, str], msg: dict) -> bytes:
+    """Return a serialized forward message.
+
+    Equivalent to forward_msg(to, msg).serialize() but without validating
+    and copying the already packed inner message into a Message.
+    """
+    return json.dumps(
+        {"@type": FORWARD, "@id": str(uuid4()), "to": ensure_key_b58(to), "msg": msg},
+        separators=(",", ":"),
+    ).encode("ascii")
+
+
 def preprocess(preprocessor: Callable):
     """Preprocess a message before handling.
 
@@ -161,37 +186,98 @@ def validate(validator: Callable, *, coerce: Optional[Callable] = None):
     return preprocess(_validate_preprocessor)
 
 
-async def http_send(msg: bytes, endpoint: str) -> Optional[bytes]:
-    """Send over HTTP."""
-    async with aiohttp.ClientSession() as session:
-        headers = {"content-type": "application/ssi-agent-wire"}
-        async with session.post(endpoint, data=msg, headers=headers) as resp:
+async def gather_or_cancel(*aws: Awaitable) -> list:
+    """Await aws concurrently, returning their results in order.
 
-            body = await resp.read()
-            if resp.status != 200 and resp.status != 202:
-                raise Exception("Error while sending message: {}".format(resp.status))
-            if resp.status == 200 and body:
-                return body
+    Unlike asyncio.gather, once one of them raises, the others are cancelled
+    and awaited before the error is raised.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
-    return None
+
+WIRE_HEADERS = {"content-type": "application/ssi-agent-wire"}
+
+
+async def http_send(
+    msg: bytes, endpoint: str, *, session: Optional[aiohttp.ClientSession] = None
+) -> Optional[bytes]:
+    """Send over HTTP.
+
+    If session is given, its connection pool is reused; otherwise a session
+    is created for this send only.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await http_send(msg, endpoint, session=session)
+
+    async with session.post(endpoint, data=msg, headers=WIRE_HEADERS) as resp:
+        if resp.status == 202:
+            # Accepted; no response body is expected
+            return None
+        if resp.status != 200:
+            raise Exception("Error while sending message: {}".format(resp.status))
+
+        body = await resp.read()
+        return body or None
+
+
+async def http_send_many(
+    jobs: Iterable[Tuple[bytes, str]],
+    *,
+    concurrency: int = 16,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> List[Optional[bytes]]:
+    """Send several (msg, endpoint) pairs over HTTP concurrently.
+
+    At most concurrency sends are in flight at once, all sharing one
+    session. Responses are returned in the order of jobs. If a send fails,
+    the sends still pending or in flight are cancelled and the error is
+    raised.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await http_send_many(jobs, concurrency=concurrency, session=session)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _send(msg: bytes, endpoint: str) -> Optional[bytes]:
+        async with semaphore:
+            return await http_send(msg, endpoint, session=session)
+
+    return await gather_or_cancel(*(_send(*job) for job in jobs))
 
 
 # TODO: Persist websocket until return_route = None sent
-async def ws_send(msg: bytes, endpoint: str) -> Optional[bytes]:
+async def ws_send(
+    msg: bytes, endpoint: str, *, session: Optional[aiohttp.ClientSession] = None
+) -> Optional[bytes]:
     """Send over WS.
 
     This send method is experimental and should not be used for more than
     experimenting. This method is very inefficient as it throws out the created
     websocket after receiving only a single msg.
+
+    As with `http_send`, a given session is reused rather than creating one
+    for this send only.
     """
-    async with aiohttp.ClientSession() as session:
-        async with session.ws_connect(endpoint) as sock:
-            await sock.send_bytes(msg)
-            async for ws_msg in sock:
-                if ws_msg.type == aiohttp.WSMsgType.BINARY:
-                    return ws_msg.data
-
-                if ws_msg.type == aiohttp.WSMsgType.ERROR:
-                    raise Exception(
-                        "ws connection closed with exception %s" % sock.exception()
-                    )
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await ws_send(msg, endpoint, session=session)
+
+    async with session.ws_connect(endpoint) as sock:
+        await sock.send_bytes(msg)
+        async for ws_msg in sock:
+            if ws_msg.type == aiohttp.WSMsgType.BINARY:
+                return ws_msg.data
+
+            if ws_msg.type == aiohttp.WSMsgType.ERROR:
+                raise Exception(
+                    "ws connection closed with exception %s" % sock.exception()
+                )
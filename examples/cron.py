@@ -12,15 +12,15 @@ from common import config
 def main():
     """Send message from cron job."""
     keys, target, _args = config()
-    conn = Connection(keys, target)
-    conn.send(
-        {
-            "@type": "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/basicmessage/1.0/message",
-            "~l10n": {"locale": "en"},
-            "sent_time": utils.timestamp(),
-            "content": "The Cron script was executed.",
-        }
-    )
+    with Connection(keys, target) as conn:
+        conn.send(
+            {
+                "@type": "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/basicmessage/1.0/message",
+                "~l10n": {"locale": "en"},
+                "sent_time": utils.timestamp(),
+                "content": "The Cron script was executed.",
+            }
+        )
 
 
 if __name__ == "__main__":
@@ -19,16 +19,17 @@ def main():
             endpoint="http://localhost:{}".format(os.environ.get("PORT", 3000)),
         ),
     )
-    reply = conn.send_and_await_returned(
-        {
-            "@type": "https://didcomm.org/basicmessage/1.0/message",
-            "~l10n": {"locale": "en"},
-            "sent_time": utils.timestamp(),
-            "content": "The Cron script has been executed.",
-        },
-        return_route="all",
-    )
-    print("Msg from conn:", reply and reply.pretty_print())
+    with conn:
+        reply = conn.send_and_await_returned(
+            {
+                "@type": "https://didcomm.org/basicmessage/1.0/message",
+                "~l10n": {"locale": "en"},
+                "sent_time": utils.timestamp(),
+                "content": "The Cron script has been executed.",
+            },
+            return_route="all",
+        )
+        print("Msg from conn:", reply and reply.pretty_print())
 
 
 if __name__ == "__main__":
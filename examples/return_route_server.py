@@ -41,6 +41,7 @@ def main():
 
     app = web.Application()
     app.add_routes([web.post("/", handle)])
+    app.on_cleanup.append(lambda _app: conn.close())
 
     web.run_app(app, port=os.environ.get("PORT", 3000))
 
@@ -55,6 +55,7 @@ def main():
 
     app = web.Application()
     app.add_routes([web.get("/", ws_handle), web.post("/", post_handle)])
+    app.on_cleanup.append(lambda _app: conn.close())
 
     web.run_app(app, port=args.port)
 
@@ -0,0 +1,28 @@
+""" Shared test fixtures. """
+
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+import pytest
+
+
+@pytest.fixture
+def serve(unused_tcp_port):
+    """Serve aiohttp routes on localhost for the duration of an async with.
+
+    Usage: `async with serve(web.post("/", handle)) as endpoint: ...`
+    """
+
+    @asynccontextmanager
+    async def _serve(*routes: web.RouteDef):
+        app = web.Application()
+        app.add_routes(routes)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, "localhost", unused_tcp_port).start()
+            yield "http://localhost:{}".format(unused_tcp_port)
+        finally:
+            await runner.cleanup()
+
+    return _serve
@@ -1,7 +1,12 @@
 """ Test Connection. """
 
+import asyncio
+import gc
 import hashlib
 from collections import namedtuple
+import warnings
+import aiohttp
+from aiohttp import web
 import pytest
 from aries_staticagent import Connection, Keys, MessageDeliveryError, crypto
 
@@ -195,3 +200,71 @@ def test_message_delivery_error():
     error = MessageDeliveryError(status=10, msg="asdf")
     assert error.status == 10
     assert str(error) == "asdf"
+
+
+@pytest.mark.asyncio
+async def test_http_session_reused(my_test_info, their_test_info, serve):
+    """Test default HTTP send reuses one client session until closed."""
+    received = []
+
+    async def handle(request):
+        received.append(await request.read())
+        raise web.HTTPAccepted()
+
+    async with serve(web.post("/", handle)) as endpoint:
+        async with Connection.from_parts(
+            my_test_info.keys,
+            their_vk=their_test_info.keys.verkey,
+            endpoint=endpoint,
+        ) as conn:
+            await conn.send_async({"@type": "doc/protocol/1.0/test"})
+            http_session = conn._http_sessions[asyncio.get_running_loop()]
+            await conn.send_async({"@type": "doc/protocol/1.0/test"})
+            assert conn._http_sessions == {asyncio.get_running_loop(): http_session}
+        assert http_session.closed
+        assert not conn._http_sessions
+        assert len(received) == 2
+
+
+def test_http_session_across_loops(my_test_info, their_test_info, serve):
+    """Test the same connection sends from one loop after another."""
+    received = []
+
+    async def handle(request):
+        received.append(await request.read())
+        raise web.HTTPAccepted()
+
+    conn = Connection.from_parts(
+        my_test_info.keys, their_vk=their_test_info.keys.verkey
+    )
+
+    async def send_once():
+        async with serve(web.post("/", handle)) as endpoint:
+            conn.target.update(endpoint=endpoint)
+            await conn.send_async({"@type": "doc/protocol/1.0/test"})
+
+    gc.collect()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        asyncio.run(send_once())
+        asyncio.run(send_once())
+        with conn:
+            conn._run_blocking(send_once())
+        asyncio.run(send_once())
+        asyncio.run(conn.close())
+        del conn
+        gc.collect()
+
+    assert len(received) == 4
+    leaked = (aiohttp.ClientSession, aiohttp.BaseConnector)
+    assert not [str(w.message) for w in caught if isinstance(w.source, leaked)]
+
+
+def test_configure_loop():
+    """Test loops are configured with eager tasks where supported."""
+    loop = asyncio.new_event_loop()
+    try:
+        Connection.configure_loop(loop)
+        assert loop.get_task_factory() is getattr(asyncio, "eager_task_factory", None)
+    finally:
+        loop.close()
@@ -21,3 +21,13 @@ def test_b64_to_bytes_urlsafe_padding():
 
     assert b64decode(padded, urlsafe=True).decode("ascii") == decoded
     assert b64decode(unpadded, urlsafe=True).decode("ascii") == decoded
+
+
+def test_pack_message_bytes():
+    """Test packing accepts str and bytes messages alike."""
+    verkey, sigkey = crypto.create_keypair()
+    for message in ('{"test": "str"}', b'{"test": "bytes"}'):
+        packed = crypto.pack_message(message, [verkey], verkey, sigkey)
+        unpacked, sender, _ = crypto.unpack_message(dict(packed), verkey, sigkey)
+        assert unpacked == (message if isinstance(message, str) else message.decode())
+        assert sender == crypto.bytes_to_b58(verkey)
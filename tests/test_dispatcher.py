@@ -3,6 +3,7 @@ import asyncio
 from collections import namedtuple
 import pytest
 
+from aries_staticagent.dispatcher.future_dispatcher import FutureDispatcher
 from aries_staticagent.dispatcher.handler_dispatcher import (
     HandlerDispatcher as Dispatcher,
     NoRegisteredHandlerException,
@@ -26,6 +27,18 @@ def test_clear():
     assert not dispatcher.handlers
 
 
+def test_selection_remembered_until_routes_change():
+    """Test selections are cached and invalidated on add and remove."""
+    dispatcher = Dispatcher()
+    dispatcher.add(MsgType("doc;protocol/1.0/name"), "one-zero")
+    msg = MockMessage(MsgType("doc;protocol/1.0/name"), True)
+    assert dispatcher.select(msg) == "one-zero"
+    dispatcher.add(MsgType("doc;protocol/1.1/name"), "one-one")
+    assert dispatcher.select(msg) == "one-one"
+    dispatcher.remove(MsgType("doc;protocol/1.1/name"))
+    assert dispatcher.select(msg) == "one-zero"
+
+
 @pytest.mark.asyncio
 async def test_dispatching():
     """Test that routing works in agent."""
@@ -127,3 +140,90 @@ async def test_dispatching_selection_message_too_old():
     )
     with pytest.raises(NoRegisteredHandlerException):
         await dispatcher.dispatch(test_msg)
+
+
+@pytest.mark.asyncio
+async def test_future_dispatcher():
+    """Test future dispatcher claims first matching message only."""
+    primary = Dispatcher()
+    delegated = []
+
+    async def handler(msg):
+        delegated.append(msg)
+
+    primary.add(MsgType("test_protocol/1.0/testing_type"), handler)
+    primary.add(MsgType("test_protocol/1.0/other_type"), handler)
+    dispatcher = FutureDispatcher(dispatcher=primary)
+    conditional = dispatcher.future(condition=lambda msg: msg["test"] == "claim")
+    typed = dispatcher.future(msg_type="test_protocol/1.0/other_type")
+
+    skipped = Message.parse_obj(
+        {"@type": "test_protocol/1.0/testing_type", "test": "skip"}
+    )
+    claimed = Message.parse_obj(
+        {"@type": "test_protocol/1.0/testing_type", "test": "claim"}
+    )
+    second = Message.parse_obj(
+        {"@type": "test_protocol/1.0/testing_type", "test": "claim"}
+    )
+    other = Message.parse_obj({"@type": "test_protocol/1.0/other_type", "test": "a"})
+    await dispatcher.dispatch(skipped)
+    assert not conditional.done()
+    await dispatcher.dispatch(claimed)
+    await dispatcher.dispatch(second)
+    await dispatcher.dispatch(other)
+    assert await conditional is claimed
+    assert await typed is other
+    assert delegated == [skipped, second]
+
+
+@pytest.mark.asyncio
+async def test_future_dispatcher_discards_cancelled():
+    """Test cancelled futures are no longer tracked."""
+    dispatcher = FutureDispatcher()
+    dispatcher.future(msg_type="test_protocol/1.0/testing_type").cancel()
+    dispatcher.future().cancel()
+    await asyncio.sleep(0)
+    assert not dispatcher._by_type
+    assert not dispatcher._conditional
+    assert not dispatcher.claim(
+        Message.parse_obj({"@type": "test_protocol/1.0/testing_type"})
+    )
+
+
+@pytest.mark.asyncio
+async def test_future_dispatcher_any_of_types():
+    """Test a future awaiting several types is resolved by any one of them."""
+    dispatcher = FutureDispatcher()
+    future = dispatcher.future(
+        msg_type=["test_protocol/1.0/ack", "test_protocol/1.0/problem_report"]
+    )
+    msg = Message.parse_obj({"@type": "test_protocol/1.0/problem_report"})
+    assert dispatcher.claim(msg)
+    assert await future is msg
+    await asyncio.sleep(0)
+    assert not dispatcher._by_type
+
+
+@pytest.mark.asyncio
+async def test_future_dispatcher_claims_in_order():
+    """Test waiters are resolved in order, each by a single message."""
+    dispatcher = FutureDispatcher()
+    first = dispatcher.future(msg_type="test_protocol/1.0/testing_type")
+    second = dispatcher.future(msg_type="test_protocol/1.0/testing_type")
+    msgs = [
+        Message.parse_obj({"@type": "test_protocol/1.0/testing_type"}) for _ in range(3)
+    ]
+    assert [dispatcher.claim(msg) for msg in msgs] == [True, True, False]
+    assert await first is msgs[0]
+    assert await second is msgs[1]
+
+
+@pytest.mark.asyncio
+async def test_future_dispatcher_no_types():
+    """Test a future cannot await an empty set of types."""
+    dispatcher = FutureDispatcher()
+    with pytest.raises(ValueError):
+        dispatcher.future(msg_type=[])
+    assert not dispatcher._by_type
+    assert not dispatcher._conditional
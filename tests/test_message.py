@@ -11,6 +11,7 @@ from aries_staticagent.message import (
     MsgType,
     MsgVersion,
     Message,
+    ProtocolIdentifier,
 )
 
 TEST_TYPE = "test_type/protocol/1.0/test"
@@ -94,6 +95,15 @@ def test_bad_message_type(type_str):
         MsgType(type_str)
 
 
+def test_msg_type_interned():
+    """Test parsing the same type string returns the same instance."""
+    assert MsgType(TEST_TYPE) is MsgType(TEST_TYPE)
+    assert Message.parse_obj({"@type": TEST_TYPE}).type is MsgType(TEST_TYPE)
+    assert ProtocolIdentifier("doc/protocol/1.0") is ProtocolIdentifier(
+        "doc/protocol/1.0"
+    )
+
+
 @pytest.mark.parametrize("id_", [{"id": "12345"}, [1, 2, 3, 4, 5]])
 def test_bad_message_id(id_):
     """Test message with bad message id"""
@@ -105,6 +115,11 @@ def test_message_getitem():
     msg = Message(**{"@id": "test", "@type": "doc/protocol/1.0/name"})
     assert msg["@id"] == "test" == msg.id
     assert msg["@type"] == "doc/protocol/1.0/name" == msg.type
+    assert "@id" in msg
+    assert "~transport" not in msg
+    assert msg.get("~transport") is None
+    assert msg.get("~transport", {}) == {}
+    assert msg.return_route is None
 
 
 @pytest.mark.parametrize(
@@ -113,12 +128,19 @@ def test_message_getitem():
         ("1.0", "1.0.0"),
         ("1.0.0", "1.0.0"),
         ("1.0.0-build", "1.0.0-build"),
+        ("10.20", "10.20.0"),
     ],
 )
 def test_msg_version(in_str, expected):
     assert str(MsgVersion.from_str(in_str)) == expected
 
 
+@pytest.mark.parametrize("in_str", ["1", "01.0", "1.+1", "1. 0", "1.0.0.0", "a.b"])
+def test_bad_msg_version(in_str):
+    with pytest.raises(ValueError):
+        MsgVersion.from_str(in_str)
+
+
 def test_subclass():
     class MyMessage(BaseMessage):
         msg_type = MsgType.unparse(
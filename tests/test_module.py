@@ -63,6 +63,9 @@ def test_routes_construction():
     assert len(TestModule.route)
     assert "test_doc_uri/test_protocol/1.0/test" in mod.routes
     assert "test_doc_uri/test_protocol/1.0/test1" in mod.routes
+    assert mod.routes["test_doc_uri/test_protocol/1.0/test"].__self__ is mod
+    with pytest.raises(TypeError):
+        mod.routes["test_doc_uri/test_protocol/1.0/test"] = None
 
 
 def test_module_type_helper():
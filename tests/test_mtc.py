@@ -105,3 +105,39 @@ def test_bad_set():
 
     with pytest.raises(TypeError):
         MessageTrustContext()[CONFIDENTIALITY] = 10
+
+
+def test_convenience_setters():
+    """Test set_* and is_* convenience methods agree."""
+    mtc = MessageTrustContext()
+    assert not mtc.is_authcrypted()
+    assert not mtc.is_anoncrypted()
+    assert not mtc.is_plaintext()
+
+    mtc.set_authcrypted("sender", "recipient")
+    assert mtc.is_authcrypted()
+    assert not mtc.is_anoncrypted()
+    assert not mtc.is_plaintext()
+
+    mtc.set_anoncrypted("recipient")
+    assert mtc.is_anoncrypted()
+    assert not mtc.is_authcrypted()
+    assert not mtc.is_plaintext()
+
+    mtc.set_plaintext()
+    assert mtc.is_plaintext()
+    assert not mtc.is_authcrypted()
+    assert not mtc.is_anoncrypted()
+
+
+def test_additional_data_not_shared():
+    """Test fresh contexts don't share additional data."""
+    first = MessageTrustContext()
+    first.additional_data.sender = "sender"
+    assert MessageTrustContext().sender is None
+
+    plaintext = MessageTrustContext()
+    plaintext.set_plaintext()
+    plaintext.additional_data.recipient = "recipient"
+    assert MessageTrustContext().recipient is None
+    assert first.recipient is None
@@ -43,6 +43,7 @@ def test_msg_type_is_compatibile_with(message):
 
 def test_in_protocol(message):
     assert in_protocol("doc;protocol/1.0", message)
+    assert not in_protocol("doc;other-protocol/1.0", message)
 
 
 def test_is_reply_to():
@@ -44,6 +44,27 @@ def test_pack_unpack_auth(alice, bob):
     assert unpacked_msg.mtc.recipient == bob.verkey_b58
 
 
+def test_pack_cacheable(alice, bob):
+    """Test cacheable packing reuses packed bytes for the same message."""
+    msg = Message.parse_obj({"@type": "doc;protocol/1.0/name"})
+    packed_msg = alice.pack(msg, cacheable=True)
+    assert alice.pack(msg, cacheable=True) is packed_msg
+    assert alice.pack(msg) != packed_msg
+    assert alice.pack(msg, anoncrypt=True, cacheable=True) != packed_msg
+    assert bob.unpack(packed_msg) == msg
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, Connection.PACK_OFFLOAD_MIN])
+async def test_pack_async(alice, bob, size):
+    """Test packing small messages inline and large ones in an executor."""
+    msg = Message.parse_obj({"@type": "doc;protocol/1.0/name", "content": "a" * size})
+    packed_msg = await alice.pack_async(msg)
+    unpacked_msg = bob.unpack(packed_msg)
+    assert unpacked_msg == msg
+    assert unpacked_msg.mtc.is_authcrypted()
+
+
 def test_pack_unpack_anon(alice, bob):
     """Test the pack-unpack loop with anoncrypt."""
     msg = {"@type": "doc;protocol/1.0/name"}
@@ -1,5 +1,6 @@
 """Test StaticConection send method."""
 import asyncio
+import gc
 import uuid
 import copy
 from functools import partial
@@ -59,6 +60,23 @@ def alice(alice_gen):
     return alice_gen()
 
 
+@pytest.fixture
+def blocking_loops():
+    """Loops created by blocking_loop_factory."""
+    return []
+
+
+@pytest.fixture
+def blocking_loop_factory(blocking_loops):
+    """Loop factory for blocking calls, recording loops in blocking_loops."""
+
+    def _factory():
+        blocking_loops.append(asyncio.new_event_loop())
+        return blocking_loops[-1]
+
+    return _factory
+
+
 @pytest.fixture
 def bob_gen(alice_keys, bob_keys):
     def _gen(send=None, dispatcher=None):
@@ -158,6 +176,18 @@ async def test_outbound_return_route_set(alice_gen, bob, send, message):
     assert sent["~transport"]["return_route"] == "all"
 
 
+@pytest.mark.asyncio
+async def test_outbound_return_route_set_on_dict(alice_gen, bob, send):
+    """Test return route added to dict messages without altering the dict."""
+    alice = alice_gen(send)
+
+    new_msg = {"@type": "doc;protocol/1.0/name"}
+    await alice.send_async(new_msg, return_route="all")
+    sent = bob.unpack(send.sent_message)
+    assert sent["~transport"]["return_route"] == "all"
+    assert "~transport" not in new_msg
+
+
 @pytest.mark.asyncio
 async def test_outbound_return_route_set_by_msg(
     alice_gen, bob, send, message, response, dispatcher
@@ -183,6 +213,52 @@ async def test_session_all(alice, bob, reply, message):
     assert bob.unpack(reply.replied) == message
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", [True, False])
+async def test_session_send_function(alice, is_async):
+    """Test sessions accept both coroutine functions and plain functions."""
+    sent = []
+
+    def _send(msg: bytes):
+        sent.append(msg)
+
+    async def _send_async(msg: bytes):
+        sent.append(msg)
+
+    with alice.session(_send_async if is_async else _send) as session:
+        session._thread = Session.THREAD_ALL
+        await session.send(b"packed")
+    assert sent == [b"packed"]
+
+
+def test_session_closed_on_error(alice, reply):
+    """Test session is removed from connection even when an error occurs."""
+    with pytest.raises(RuntimeError):
+        with alice.session(reply):
+            assert alice.session_open()
+            raise RuntimeError("boom")
+    assert not alice.session_open()
+
+
+@pytest.mark.parametrize(
+    "transport, expected",
+    [
+        (None, Session.THREAD_ALL),
+        ({}, Session.THREAD_ALL),
+        ({"return_route": "none"}, None),
+        ({"return_route": "thread", "return_route_thread": "thid"}, "thid"),
+    ],
+)
+def test_session_update_thread(alice, reply, message, transport, expected):
+    """Test session return route follows the ~transport decorator."""
+    if transport is not None:
+        message = Message.parse_obj({**message, "~transport": transport})
+    with alice.session(reply) as session:
+        session._thread = Session.THREAD_ALL
+        session.update_thread_from_msg(message)
+        assert session._thread == expected
+
+
 @pytest.mark.asyncio
 async def test_session_thread(alice, bob, reply, message):
     """Test reply mechanism."""
@@ -277,6 +353,72 @@ async def test_next_type(alice_gen, bob, dispatcher, message, response):
     assert dispatcher.dispatched == response
 
 
+@pytest.mark.asyncio
+async def test_handle_many(alice_gen, bob, message, response):
+    """Test a batch of messages is unpacked and dispatched."""
+    handled = []
+
+    class _Dispatcher:
+        async def dispatch(self, msg, conn):
+            handled.append(msg)
+
+    alice = alice_gen(dispatcher=_Dispatcher())
+    await alice.handle_many([bob.pack(message), bob.pack(response)])
+    assert handled == [message, response]
+
+
+@pytest.mark.asyncio
+async def test_handle_many_session_return_route(alice_gen, bob, message, response):
+    """Test each message's return route applies while it is dispatched."""
+    return_routes = []
+    sessions = []
+
+    class _Dispatcher:
+        async def dispatch(self, msg, conn):
+            await asyncio.sleep(0)
+            return_routes.append(sessions[0].should_return_route())
+
+    alice = alice_gen(dispatcher=_Dispatcher())
+    with alice.session(lambda _: None) as session:
+        sessions.append(session)
+        await alice.handle_many(
+            [
+                bob.pack(message.with_transport(return_route="all")),
+                bob.pack(response.with_transport(return_route="none")),
+            ],
+            session,
+        )
+    assert return_routes == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_handle_many_cancels_on_error(alice_gen, bob, message, response):
+    """Test a failed dispatch cancels the rest of the batch."""
+    cancelled = asyncio.Event()
+
+    class _Dispatcher:
+        async def dispatch(self, msg, conn):
+            if msg == message:
+                raise ValueError("dispatch failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    alice = alice_gen(dispatcher=_Dispatcher())
+    with pytest.raises(ValueError):
+        await alice.handle_many([bob.pack(response), bob.pack(message)])
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_await_message_no_types(alice):
+    """Test awaiting an empty set of types is rejected, not any message."""
+    with pytest.raises(ValueError):
+        await alice.await_message(type_=[])
+
+
 @pytest.mark.asyncio
 async def test_multiple_next_fulfilled_sequentially(alice, bob, message):
     """Test all matching next condtions are fulfilled."""
@@ -307,6 +449,35 @@ async def test_send_and_await_reply(alice_gen, bob, send, message, response):
     assert response == response_with_thid
 
 
+@pytest.mark.asyncio
+async def test_request_response(alice_gen, bob, send, dispatcher, message, response):
+    """Test request_response returns the response without dispatching it."""
+    alice = alice_gen(partial(send.return_response, bob.pack(response)), dispatcher)
+    assert await alice.request_response(message) == response
+    assert bob.unpack(send.sent_message).return_route == "all"
+    assert dispatcher.dispatched is None
+
+
+@pytest.mark.asyncio
+async def test_request_response_no_response(alice_gen, send, message):
+    """Test request_response raises when nothing is returned."""
+    alice = alice_gen(send)
+    with pytest.raises(MessageDeliveryError):
+        await alice.request_response(message)
+
+
+@pytest.mark.asyncio
+async def test_request_response_timeout(alice_gen, message):
+    """Test request_response times out when no response is returned."""
+
+    async def _send(msg, endpoint):
+        await asyncio.sleep(10)
+
+    alice = alice_gen(_send)
+    with pytest.raises(asyncio.TimeoutError):
+        await alice.request_response(message, timeout=0.01)
+
+
 @pytest.mark.asyncio
 async def test_await_message(alice, bob, message):
     """Test awaiting a message."""
@@ -339,3 +510,42 @@ def test_blocking_send_and_await_reply(alice_gen, bob, send, message, response):
     alice = alice_gen(partial(send.return_response, bob.pack(response_with_thid)))
     response = alice.send_and_await_reply(msg_with_id)
     assert response == response_with_thid
+
+
+def test_blocking_send_reuses_loop(alice_gen, bob, send, message):
+    """Test blocking sends share one loop until the connection is closed."""
+    alice = alice_gen(send=send)
+    alice.send(message)
+    loop = alice._blocking_loop
+    alice.send(message)
+    assert alice._blocking_loop is loop
+    assert bob.unpack(send.sent_message) == message
+    with alice:
+        alice.send(message)
+        assert alice._blocking_loop is loop
+    assert loop.is_closed()
+    assert alice._blocking_loop is None
+
+
+def test_blocking_loop_released_on_collection(
+    alice_gen, send, message, blocking_loops, blocking_loop_factory
+):
+    """Test the blocking loop is closed once the connection is collected."""
+    alice = alice_gen(send=send)
+    alice.BLOCKING_LOOP_FACTORY = blocking_loop_factory
+    alice.send(message)
+    del alice
+    gc.collect()
+    assert len(blocking_loops) == 1
+    assert blocking_loops[0].is_closed()
+
+
+def test_blocking_loop_factory(
+    alice_gen, send, message, blocking_loops, blocking_loop_factory
+):
+    """Test blocking calls run on a loop from the configured factory."""
+    with alice_gen(send=send) as alice:
+        alice.BLOCKING_LOOP_FACTORY = blocking_loop_factory
+        alice.send(message)
+        assert alice._blocking_loop is blocking_loops[0]
+    assert blocking_loops[0].is_closed()
@@ -1,5 +1,8 @@
 """ Test utilities. """
 
+import asyncio
+import aiohttp
+from aiohttp import web
 import pytest
 
 from aries_staticagent import utils, Message
@@ -196,3 +199,111 @@ def test_anoncrypted_decorator_not_met(message):
     message.mtc[ANONCRYPT_AFFIRMED] = True
     with pytest.raises(utils.InsufficientMessageTrust):
         mtc_test(message)
+
+
+@pytest.mark.parametrize(
+    "status, body, expected",
+    [(202, b"", None), (200, b"", None), (200, b"response", b"response")],
+)
+@pytest.mark.asyncio
+async def test_http_send(serve, status, body, expected):
+    """Test http_send returns response bodies only when present."""
+
+    async def handle(request):
+        return web.Response(status=status, body=body)
+
+    async with serve(web.post("/", handle)) as endpoint:
+        assert await utils.http_send(b"message", endpoint) == expected
+
+
+@pytest.mark.asyncio
+async def test_ws_send_with_session(serve):
+    """Test ws_send uses a given client session and leaves it open."""
+
+    async def handle(request):
+        sock = web.WebSocketResponse()
+        await sock.prepare(request)
+        async for ws_msg in sock:
+            await sock.send_bytes(b"echo: " + ws_msg.data)
+        return sock
+
+    async with serve(web.get("/", handle)) as endpoint:
+        async with aiohttp.ClientSession() as session:
+            for _ in range(2):
+                response = await utils.ws_send(b"message", endpoint, session=session)
+                assert response == b"echo: message"
+            assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_http_send_many(serve):
+    """Test http_send_many returns responses in order with bounded sends."""
+    in_flight = []
+    max_in_flight = []
+
+    async def handle(request):
+        in_flight.append(request)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return web.Response(status=200, body=await request.read())
+
+    async with serve(web.post("/", handle)) as endpoint:
+        jobs = [(str(i).encode(), endpoint) for i in range(5)]
+        responses = await utils.http_send_many(jobs, concurrency=2)
+        assert responses == [msg for msg, _ in jobs]
+        assert max(max_in_flight) <= 2
+
+
+@pytest.mark.asyncio
+async def test_http_send_many_error(serve):
+    """Test http_send_many stops sending once a send fails."""
+    sent = []
+
+    async def fail(request):
+        return web.Response(status=500)
+
+    async def handle(request):
+        sent.append(await request.read())
+        raise web.HTTPAccepted()
+
+    async with serve(web.post("/fail", fail), web.post("/", handle)) as endpoint:
+        jobs = [(b"fail", endpoint + "/fail")] + [(b"message", endpoint)] * 5
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(Exception, match="500"):
+                await utils.http_send_many(jobs, concurrency=1, session=session)
+            await asyncio.sleep(0.1)
+        # The send let in as the failed one finished may already be out
+        assert len(sent) <= 1
+
+
+@pytest.mark.asyncio
+async def test_http_send_error(serve):
+    """Test http_send raises on unexpected status."""
+
+    async def handle(request):
+        return web.Response(status=500)
+
+    async with serve(web.post("/", handle)) as endpoint:
+        with pytest.raises(Exception, match="500"):
+            await utils.http_send(b"message", endpoint)
+
+
+def test_normalize_key():
+    """Test normalize_key returns bytes and b58 forms for either input."""
+    key_bytes = b"\x01" * 32
+    key_b58 = utils.ensure_key_b58(key_bytes)
+    assert utils.normalize_key(key_bytes) == (key_bytes, key_b58)
+    assert utils.normalize_key(key_b58) == (key_bytes, key_b58)
+    with pytest.raises(TypeError):
+        utils.normalize_key(10)
+
+
+def test_serialize_forward():
+    """Test serialized forward messages match forward_msg."""
+    to = b"\x01" * 32
+    inner = {"protected": "abc", "ciphertext": "def"}
+    msg = Message.deserialize(utils.serialize_forward(to, inner))
+    expected = utils.forward_msg(to, inner)
+    assert msg.type == utils.FORWARD
+    assert {**msg, "@id": None} == {**expected, "@id": None}